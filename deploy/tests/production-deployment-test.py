@@ -4,33 +4,100 @@ K-OCR Web Corrector - Production Deployment Test
 프로덕션 환경 배포 테스트 및 검증
 """
 
+import atexit
 import os
+import re
 import sys
 import json
 import time
+import socket
+import ssl
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 import logging
-import subprocess
-import yaml
-from datetime import datetime, timedelta
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 import concurrent.futures
+from functools import cached_property
 from pathlib import Path
 
 # 외부 라이브러리 (설치 필요시)
+# 클라우드 SDK는 선택된 프로바이더만 _initialize_clients 에서 지연 import
 try:
-    import boto3
     import kubernetes
     from kubernetes import client, config
-    from google.cloud import container_v1
-    from azure.identity import DefaultAzureCredential
-    from azure.mgmt.containerservice import ContainerServiceClient
-    import psutil
-    import prometheus_client.parser
+    from kubernetes.client.rest import ApiException
+    from kubernetes.stream import stream
 except ImportError as e:
     print(f"Warning: Some optional dependencies not available: {e}")
-    print("Install with: pip install boto3 kubernetes google-cloud-container azure-identity azure-mgmt-containerservice psutil prometheus-client")
+    print("Install with: pip install kubernetes boto3 google-cloud-container azure-identity azure-mgmt-containerservice")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from cryptography import x509
+except ImportError:
+    x509 = None
+
+
+def _json_default(value):
+    """표준 json 폴백에서 orjson 과 같은 방식으로 datetime 직렬화"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump_json_bytes(data, indent: bool = True) -> bytes:
+    """JSON 직렬화 (orjson 사용 가능 시 C 확장 사용)"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    return json.dumps(
+        data, indent=2 if indent else None, ensure_ascii=False, default=_json_default
+    ).encode('utf-8')
+
+
+def _fetch_certificate_expiry(context: ssl.SSLContext, hostname: str, port: int,
+                              timeout: float = 10) -> float:
+    """TLS 핸드셰이크 후 서버 인증서 만료 시각(epoch 초) 반환"""
+    with socket.create_connection((hostname, port), timeout=timeout) as sock:
+        with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+            if x509 is None:
+                return ssl.cert_time_to_seconds(ssock.getpeercert()['notAfter'])
+            der = ssock.getpeercert(binary_form=True)
+
+    # DER 인증서를 직접 파싱 (문자열 날짜 파싱 없음)
+    cert = x509.load_der_x509_certificate(der)
+    not_after = getattr(cert, 'not_valid_after_utc', None)
+    if not_after is None:
+        # cryptography < 42 는 naive UTC datetime 반환
+        not_after = cert.not_valid_after.replace(tzinfo=timezone.utc)
+    return not_after.timestamp()
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """유휴 연결이 NAT/LB 에서 끊기지 않도록 TCP keepalive 를 켠 어댑터"""
+
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ] + [
+        (socket.IPPROTO_TCP, getattr(socket, name), value)
+        for name, value in (('TCP_KEEPIDLE', 60), ('TCP_KEEPINTVL', 10), ('TCP_KEEPCNT', 3))
+        if hasattr(socket, name)
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
 
 
 @dataclass
@@ -45,7 +112,9 @@ class ProductionTestConfig:
     # 애플리케이션 설정
     app_domain: str = "k-ocr.yourdomain.com"
     app_port: int = 443
+    ca_bundle: Optional[str] = None  # HTTPS 검증용 CA 파일 (미지정 시 certifi 번들)
     health_check_endpoint: str = "/health"
+    tls_domains: List[str] = field(default_factory=list)  # app_domain 외 인증서 확인 대상
     api_prefix: str = "/api/v1"
 
     # 테스트 설정
@@ -79,19 +148,107 @@ class TestResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+@dataclass
+class LatencyHistogram:
+    """밀리초 버킷 응답 시간 히스토그램 (샘플 수와 무관한 메모리)"""
+    buckets: Counter = field(default_factory=Counter)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """응답 시간 기록"""
+        self.buckets[int(seconds * 1000)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """백분위 응답 시간 (버킷 상한, 초 단위)"""
+        threshold = self.count * pct / 100
+        cumulative = 0
+        for bucket_ms in sorted(self.buckets):
+            cumulative += self.buckets[bucket_ms]
+            if cumulative >= threshold:
+                return (bucket_ms + 1) / 1000
+        return self.max
+
+
 class ProductionDeploymentTester:
     """프로덕션 환경 배포 테스트 클래스"""
 
+    # 단계 간 실행 순서 의존성 (나머지 단계는 서로 독립적)
+    PHASE_DEPENDENCIES = {
+        "Service Connectivity": {"Application Deployment"},
+        "Load Testing": {"Service Connectivity"},
+        "Performance Benchmarks": {"Load Testing"},
+    }
+
+    # 실패 시 이후 단계를 건너뛰는 핵심 단계
+    CRITICAL_PHASES = frozenset({
+        "Infrastructure Validation",
+        "Cluster Health Check",
+        "Application Deployment",
+    })
+
+    # app.kubernetes.io/name 레이블 → 애플리케이션 컴포넌트
+    APP_COMPONENTS = {
+        'k-ocr-web': 'web',
+        'k-ocr-worker': 'worker',
+        'redis': 'redis',
+        'postgres': 'postgres',
+    }
+    APP_POD_SELECTOR = f"app.kubernetes.io/name in ({','.join(APP_COMPONENTS)})"
+
+    REQUIRED_SERVICES = ('k-ocr-web', 'k-ocr-redis', 'k-ocr-postgres')
+    REQUIRED_SERVICE_RE = re.compile('|'.join(map(re.escape, REQUIRED_SERVICES)))
+
+    MONITORING_NAMESPACE = 'monitoring'
+    MONITORING_COMPONENTS = ('prometheus', 'grafana', 'alertmanager')
+
+    # 클라우드별 AZ 레이블 (우선순위 순)
+    ZONE_LABELS = ('topology.kubernetes.io/zone', 'failure-domain.beta.kubernetes.io/zone')
+
+    LIST_PAGE_SIZE = 500
+    BENCHMARK_SAMPLES = 10
+    LOG_MAX_BYTES = 50 * 1024 * 1024
+
     def __init__(self, config: ProductionTestConfig):
         """초기화"""
         self.config = config
         self.results: List[TestResult] = []
         self.logger = self._setup_logger()
         self.k8s_client = None
+        self._api_client = None
         self.cloud_client = None
+        self._aws_session = None
+
+        # 실행 중 Kubernetes 목록 조회 캐시 (단계 간 공유)
+        self._list_cache: Dict[Tuple, concurrent.futures.Future] = {}
+        self._list_cache_lock = threading.Lock()
+        # (uid, resourceVersion) → 파드 준비 여부
+        self._ready_cache: Dict[Tuple[str, str], bool] = {}
+
+        # 부하 테스트용 keep-alive 세션 (TLS 핸드셰이크 재사용)
+        self._http = self._create_http_session()
+        # 알림 등 결과와 무관한 후처리용
+        self._background = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix='production-test-bg'
+        )
 
         # 테스트 시작 시간
         self.test_start_time = datetime.now()
+        # 경과 시간 계산용 (벽시계 변경에 영향받지 않음)
+        self._t0 = time.monotonic()
+
+    def close(self) -> None:
+        """백그라운드 작업(알림 전송 등) 완료 대기 후 자원 정리"""
+        self._background.shutdown(wait=True)
+        self._http.close()
 
     def _setup_logger(self) -> logging.Logger:
         """로거 설정"""
@@ -104,17 +261,86 @@ class ProductionDeploymentTester:
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
             )
             handler.setFormatter(formatter)
-            logger.addHandler(handler)
 
-            # 파일 로거도 추가
-            file_handler = logging.FileHandler(
-                f'production_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'
+            # 파일 로거도 추가 (크기 제한 후 회전)
+            file_handler = RotatingFileHandler(
+                f'production_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log',
+                maxBytes=self.LOG_MAX_BYTES,
+                backupCount=3
             )
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+
+            # 테스트 스레드는 큐에 넣기만 하고 출력은 리스너 스레드가 담당
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+            listener = QueueListener(log_queue, handler, file_handler)
+            listener.start()
+            atexit.register(listener.stop)
 
         return logger
 
+    def _create_http_session(self) -> requests.Session:
+        """동시 사용자 수만큼 연결을 유지하는 HTTP 세션 생성 (부하 테스트, 프로브, 알림 공용)"""
+        pool_size = self.config.load_test_users
+        session = requests.Session()
+        # 재시도는 오류율을 왜곡하므로 비활성화
+        # 호스트별 풀(앱 도메인, Slack 웹훅 등)이 서로 밀어내지 않도록 여유 있게 유지
+        adapter = KeepAliveHTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # 발급 CA 가 고정된 경우 전체 CA 번들 대신 해당 인증서만 로드
+        if self.config.ca_bundle:
+            session.verify = self.config.ca_bundle
+        return session
+
+    def _cached_list(self, list_func, **kwargs):
+        """동일한 목록 조회는 실행당 한 번만 API 서버에 요청"""
+        key = (list_func.__qualname__, tuple(sorted(kwargs.items())))
+
+        with self._list_cache_lock:
+            future = self._list_cache.get(key)
+            owner = future is None
+            if owner:
+                future = self._list_cache[key] = concurrent.futures.Future()
+
+        if owner:
+            try:
+                future.set_result(self._list_all_pages(list_func, **kwargs))
+            except Exception as e:
+                # 실패한 조회는 캐시하지 않음
+                with self._list_cache_lock:
+                    del self._list_cache[key]
+                future.set_exception(e)
+
+        return future.result()
+
+    def _list_all_pages(self, list_func, **kwargs):
+        """limit/continue 토큰으로 목록을 페이지 단위로 조회하여 병합"""
+        response = list_func(limit=self.LIST_PAGE_SIZE, **kwargs)
+        continue_token = response.metadata._continue
+
+        while continue_token:
+            page = list_func(limit=self.LIST_PAGE_SIZE, _continue=continue_token, **kwargs)
+            response.items.extend(page.items)
+            continue_token = page.metadata._continue
+
+        return response
+
+    @cached_property
+    def apps_api(self):
+        """공유 ApiClient 기반 AppsV1Api"""
+        return client.AppsV1Api(self._api_client)
+
+    @cached_property
+    def networking_api(self):
+        """공유 ApiClient 기반 NetworkingV1Api"""
+        return client.NetworkingV1Api(self._api_client)
+
+    @cached_property
+    def rbac_api(self):
+        """공유 ApiClient 기반 RbacAuthorizationV1Api"""
+        return client.RbacAuthorizationV1Api(self._api_client)
+
     def _initialize_clients(self) -> bool:
         """클라우드 클라이언트 초기화"""
         try:
@@ -124,14 +350,21 @@ class ProductionDeploymentTester:
             else:
                 config.load_incluster_config()
 
-            self.k8s_client = client.CoreV1Api()
+            # 모든 API 그룹이 하나의 ApiClient(연결 풀)를 공유
+            self._api_client = client.ApiClient()
+            self.k8s_client = client.CoreV1Api(self._api_client)
 
-            # 클라우드별 클라이언트 초기화
+            # 클라우드별 클라이언트 초기화 (해당 SDK만 import)
             if self.config.cloud_provider == "aws":
-                self.cloud_client = boto3.client('eks', region_name=self.config.region)
+                import boto3
+                self._aws_session = boto3.session.Session(region_name=self.config.region)
+                self.cloud_client = self._aws_session.client('eks')
             elif self.config.cloud_provider == "gcp":
+                from google.cloud import container_v1
                 self.cloud_client = container_v1.ClusterManagerClient()
             elif self.config.cloud_provider == "azure":
+                from azure.identity import DefaultAzureCredential
+                from azure.mgmt.containerservice import ContainerServiceClient
                 credential = DefaultAzureCredential()
                 self.cloud_client = ContainerServiceClient(
                     credential,
@@ -151,6 +384,12 @@ class ProductionDeploymentTester:
         self.logger.info(f"Test Configuration: {self.config}")
         self.logger.info("=" * 80)
 
+        # 이전 실행의 조회 결과를 재사용하지 않도록 캐시 초기화
+        with self._list_cache_lock:
+            self._list_cache.clear()
+        self._ready_cache.clear()
+        self.__dict__.pop('_has_monitoring_namespace', None)
+
         # 클라이언트 초기화
         if not self._initialize_clients():
             return {"success": False, "error": "Failed to initialize cloud clients"}
@@ -168,42 +407,93 @@ class ProductionDeploymentTester:
             ("Performance Benchmarks", self._test_performance_benchmarks)
         ]
 
+        # 독립적인 단계는 같은 계층에서 동시에 실행
         phase_results = {}
+        phase_funcs = dict(test_phases)
+
+        failed_critical = set()
+
+        for layer in self._layer_phases([name for name, _ in test_phases]):
+            # 핵심 단계가 실패하면 이후 계층(부하 테스트 등)은 실행하지 않음
+            if failed_critical:
+                for phase_name in layer:
+                    self.logger.warning(f"Skipping {phase_name}: critical phase failed ({', '.join(sorted(failed_critical))})")
+                    phase_results[phase_name] = {
+                        "success": False,
+                        "skipped": True,
+                        "duration": 0.0,
+                        "timestamp": datetime.now().isoformat()
+                    }
+                continue
 
-        for phase_name, test_func in test_phases:
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"Running: {phase_name}")
-            self.logger.info(f"{'='*60}")
-
-            start_time = time.time()
-            try:
-                result = test_func()
-                duration = time.time() - start_time
-
-                phase_results[phase_name] = {
-                    "success": result,
-                    "duration": duration,
-                    "timestamp": datetime.now().isoformat()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(layer)) as executor:
+                futures = {
+                    phase_name: executor.submit(self._run_phase, phase_name, phase_funcs[phase_name])
+                    for phase_name in layer
                 }
+                for phase_name, future in futures.items():
+                    phase_results[phase_name] = future.result()
+                    if phase_name in self.CRITICAL_PHASES and not phase_results[phase_name]["success"]:
+                        failed_critical.add(phase_name)
 
-                if result:
-                    self.logger.info(f"✅ {phase_name} completed successfully ({duration:.2f}s)")
-                else:
-                    self.logger.error(f"❌ {phase_name} failed ({duration:.2f}s)")
-
-            except Exception as e:
-                duration = time.time() - start_time
-                self.logger.error(f"❌ {phase_name} failed with exception: {e}")
-                phase_results[phase_name] = {
-                    "success": False,
-                    "duration": duration,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat()
-                }
+        # 원래 단계 순서로 정렬
+        phase_results = {name: phase_results[name] for name, _ in test_phases}
 
         # 전체 결과 요약
         return self._generate_test_summary(phase_results)
 
+    def _layer_phases(self, phase_names: List[str]) -> List[List[str]]:
+        """단계 의존성을 위상 정렬하여 동시 실행 계층으로 분할"""
+        remaining = list(phase_names)
+        completed = set()
+        layers = []
+
+        while remaining:
+            layer = [
+                name for name in remaining
+                if self.PHASE_DEPENDENCIES.get(name, set()) <= completed
+            ]
+            if not layer:
+                raise ValueError(f"Cyclic phase dependencies: {remaining}")
+
+            layers.append(layer)
+            completed.update(layer)
+            remaining = [name for name in remaining if name not in completed]
+
+        return layers
+
+    def _run_phase(self, phase_name: str, test_func) -> Dict[str, Any]:
+        """단일 테스트 단계 실행 및 결과 기록"""
+        self.logger.info(f"\n{'='*60}")
+        self.logger.info(f"Running: {phase_name}")
+        self.logger.info(f"{'='*60}")
+
+        start_time = time.time()
+        try:
+            result = test_func()
+            duration = time.time() - start_time
+
+            if result:
+                self.logger.info(f"✅ {phase_name} completed successfully ({duration:.2f}s)")
+            else:
+                self.logger.error(f"❌ {phase_name} failed ({duration:.2f}s)")
+
+            return {
+                "success": result,
+                "duration": duration,
+                "timestamp": datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(f"❌ {phase_name} failed with exception: {e}")
+            return {
+                "success": False,
+                "duration": duration,
+                "error": str(e),
+                "timestamp": datetime.now().isoformat()
+            }
+
     def _test_infrastructure_validation(self) -> bool:
         """인프라 검증 테스트"""
         try:
@@ -251,42 +541,38 @@ class ProductionDeploymentTester:
                     self.logger.error(f"Node group {ng_name} not active")
                     return False
 
-            # RDS 인스턴스 확인 (PostgreSQL)
-            rds_client = boto3.client('rds', region_name=self.config.region)
+            # RDS 인스턴스 확인 (엔진과 무관하게 모든 k-ocr 인스턴스)
+            rds_client = self._aws_session.client('rds')
             try:
-                db_instances = rds_client.describe_db_instances()
-                k_ocr_dbs = [
-                    db for db in db_instances['DBInstances']
-                    if 'k-ocr' in db['DBInstanceIdentifier'].lower()
-                ]
-
-                for db in k_ocr_dbs:
-                    if db['DBInstanceStatus'] != 'available':
-                        self.logger.error(f"Database {db['DBInstanceIdentifier']} not available")
-                        return False
+                pages = rds_client.get_paginator('describe_db_instances').paginate()
+                for page in pages:
+                    for db in page['DBInstances']:
+                        if 'k-ocr' not in db['DBInstanceIdentifier'].lower():
+                            continue
+                        if db['DBInstanceStatus'] != 'available':
+                            self.logger.error(f"Database {db['DBInstanceIdentifier']} not available")
+                            return False
 
             except Exception as e:
                 self.logger.warning(f"Could not verify RDS instances: {e}")
 
-            # ElastiCache 확인 (Redis)
-            elasticache_client = boto3.client('elasticache', region_name=self.config.region)
+            # ElastiCache 확인
+            elasticache_client = self._aws_session.client('elasticache')
             try:
-                cache_clusters = elasticache_client.describe_cache_clusters()
-                k_ocr_cache = [
-                    cluster for cluster in cache_clusters['CacheClusters']
-                    if 'k-ocr' in cluster['CacheClusterId'].lower()
-                ]
-
-                for cluster in k_ocr_cache:
-                    if cluster['CacheClusterStatus'] != 'available':
-                        self.logger.error(f"Cache cluster {cluster['CacheClusterId']} not available")
-                        return False
+                pages = elasticache_client.get_paginator('describe_cache_clusters').paginate()
+                for page in pages:
+                    for cluster in page['CacheClusters']:
+                        if 'k-ocr' not in cluster['CacheClusterId'].lower():
+                            continue
+                        if cluster['CacheClusterStatus'] != 'available':
+                            self.logger.error(f"Cache cluster {cluster['CacheClusterId']} not available")
+                            return False
 
             except Exception as e:
                 self.logger.warning(f"Could not verify ElastiCache: {e}")
 
             # Load Balancer 확인
-            elbv2_client = boto3.client('elbv2', region_name=self.config.region)
+            elbv2_client = self._aws_session.client('elbv2')
             load_balancers = elbv2_client.describe_load_balancers()
 
             active_lbs = [
@@ -308,6 +594,8 @@ class ProductionDeploymentTester:
     def _validate_gcp_production(self) -> bool:
         """GCP 프로덕션 인프라 검증"""
         try:
+            from google.cloud import container_v1
+
             project_id = os.getenv('GOOGLE_CLOUD_PROJECT')
             if not project_id:
                 self.logger.error("GOOGLE_CLOUD_PROJECT environment variable not set")
@@ -367,7 +655,7 @@ class ProductionDeploymentTester:
             self.logger.info("Checking Kubernetes cluster health...")
 
             # 노드 상태 확인
-            nodes = self.k8s_client.list_node()
+            nodes = self._cached_list(self.k8s_client.list_node)
             ready_nodes = 0
             total_nodes = len(nodes.items)
 
@@ -381,20 +669,22 @@ class ProductionDeploymentTester:
                 self.logger.error(f"Only {ready_nodes}/{total_nodes} nodes are ready")
                 return False
 
-            # 시스템 파드 상태 확인
-            system_namespaces = ['kube-system', 'kube-public', 'monitoring', 'logging']
+            # 시스템 파드 상태 확인 (비정상 파드만 서버 측에서 한 번에 조회)
+            system_namespaces = {'kube-system', 'kube-public', 'monitoring', 'logging'}
 
-            for namespace in system_namespaces:
-                try:
-                    pods = self.k8s_client.list_namespaced_pod(namespace=namespace)
+            try:
+                unhealthy_pods = self._cached_list(
+                    self.k8s_client.list_pod_for_all_namespaces,
+                    field_selector="status.phase!=Running,status.phase!=Succeeded"
+                )
 
-                    for pod in pods.items:
-                        if pod.status.phase not in ['Running', 'Succeeded']:
-                            self.logger.error(f"Pod {pod.metadata.name} in {namespace} not running: {pod.status.phase}")
-                            return False
+                for pod in unhealthy_pods.items:
+                    if pod.metadata.namespace in system_namespaces:
+                        self.logger.error(f"Pod {pod.metadata.name} in {pod.metadata.namespace} not running: {pod.status.phase}")
+                        return False
 
-                except Exception as e:
-                    self.logger.warning(f"Could not check namespace {namespace}: {e}")
+            except Exception as e:
+                self.logger.warning(f"Could not check system namespaces: {e}")
 
             # 리소스 사용량 확인
             if not self._check_cluster_resources():
@@ -411,18 +701,22 @@ class ProductionDeploymentTester:
         """클러스터 리소스 사용량 확인"""
         try:
             # 노드별 리소스 사용량 확인
-            nodes = self.k8s_client.list_node()
+            nodes = self._cached_list(self.k8s_client.list_node)
+
+            # 노드별 상세 로그는 DEBUG 에서만 포맷
+            log_details = self.logger.isEnabledFor(logging.DEBUG)
 
             for node in nodes.items:
                 # CPU 및 메모리 할당 가능량 확인
                 allocatable = node.status.allocatable
 
-                if allocatable:
-                    cpu_allocatable = allocatable.get('cpu', '0')
-                    memory_allocatable = allocatable.get('memory', '0')
-
-                    self.logger.info(f"Node {node.metadata.name}: CPU={cpu_allocatable}, Memory={memory_allocatable}")
+                if allocatable and log_details:
+                    self.logger.debug(
+                        "Node %s: CPU=%s, Memory=%s", node.metadata.name,
+                        allocatable.get('cpu', '0'), allocatable.get('memory', '0')
+                    )
 
+            self.logger.info("Checked allocatable resources on %d nodes", len(nodes.items))
             return True
 
         except Exception as e:
@@ -444,57 +738,50 @@ class ProductionDeploymentTester:
                 self.logger.error(f"Namespace {self.config.namespace} not found: {e}")
                 return False
 
-            # 애플리케이션 파드 상태 확인
-            pods = self.k8s_client.list_namespaced_pod(namespace=self.config.namespace)
+            # 애플리케이션 파드 상태 확인 (서버 측 레이블 필터)
+            pods = self._cached_list(
+                self.k8s_client.list_namespaced_pod,
+                namespace=self.config.namespace,
+                label_selector=self.APP_POD_SELECTOR
+            )
 
-            app_components = ['web', 'worker', 'redis', 'postgres']
-            component_status = {}
+            # 컴포넌트별 전체/준비 파드 수를 한 번의 순회로 집계
+            pod_counts = Counter()
+            ready_counts = Counter()
 
             for pod in pods.items:
-                pod_name = pod.metadata.name
-
-                # 컴포넌트 식별
-                component = None
-                for comp in app_components:
-                    if comp in pod_name.lower():
-                        component = comp
-                        break
-
-                if component:
-                    if component not in component_status:
-                        component_status[component] = []
-
-                    component_status[component].append({
-                        'name': pod_name,
-                        'status': pod.status.phase,
-                        'ready': self._is_pod_ready(pod)
-                    })
+                component = self.APP_COMPONENTS[pod.metadata.labels['app.kubernetes.io/name']]
+                pod_counts[component] += 1
+                if self._is_pod_ready(pod):
+                    ready_counts[component] += 1
 
             # 각 컴포넌트가 최소 하나씩은 실행 중인지 확인
-            for component in app_components:
-                if component not in component_status:
+            for component in self.APP_COMPONENTS.values():
+                if not pod_counts[component]:
                     self.logger.error(f"No {component} pods found")
                     return False
 
-                ready_pods = [p for p in component_status[component] if p['ready']]
-                if not ready_pods:
+                if not ready_counts[component]:
                     self.logger.error(f"No ready {component} pods found")
                     return False
 
-                self.logger.info(f"✅ {component}: {len(ready_pods)} pods ready")
+                self.logger.info(f"✅ {component}: {ready_counts[component]} pods ready")
 
             # 서비스 확인
-            services = self.k8s_client.list_namespaced_service(namespace=self.config.namespace)
-
-            required_services = ['k-ocr-web', 'k-ocr-redis', 'k-ocr-postgres']
-            for service_name in required_services:
-                service_found = False
-                for service in services.items:
-                    if service_name in service.metadata.name:
-                        service_found = True
-                        break
-
-                if not service_found:
+            services = self._cached_list(
+                self.k8s_client.list_namespaced_service,
+                namespace=self.config.namespace
+            ).items
+
+            # 필수 서비스 이름을 한 번의 정규식 패스로 수집
+            found_services = set()
+            for service in services:
+                match = self.REQUIRED_SERVICE_RE.search(service.metadata.name)
+                if match:
+                    found_services.add(match.group(0))
+
+            for service_name in self.REQUIRED_SERVICES:
+                if service_name not in found_services:
                     self.logger.error(f"Required service {service_name} not found")
                     return False
 
@@ -506,7 +793,16 @@ class ProductionDeploymentTester:
             return False
 
     def _is_pod_ready(self, pod) -> bool:
-        """파드가 준비 상태인지 확인"""
+        """파드가 준비 상태인지 확인 (리소스 버전별 결과 재사용)"""
+        key = (pod.metadata.uid, pod.metadata.resource_version)
+        ready = self._ready_cache.get(key)
+        if ready is None:
+            ready = self._ready_cache[key] = self._evaluate_pod_ready(pod)
+        return ready
+
+    @staticmethod
+    def _evaluate_pod_ready(pod) -> bool:
+        """파드 상태 조건으로 준비 여부 판정"""
         if pod.status.phase != 'Running':
             return False
 
@@ -530,7 +826,7 @@ class ProductionDeploymentTester:
             # Health check endpoint 테스트
             health_url = f"{app_url}{self.config.health_check_endpoint}"
 
-            response = requests.get(health_url, timeout=10, verify=True)
+            response = self._http.get(health_url, timeout=10)
 
             if response.status_code != 200:
                 self.logger.error(f"Health check failed: {response.status_code}")
@@ -544,7 +840,7 @@ class ProductionDeploymentTester:
 
             for endpoint in api_endpoints:
                 try:
-                    response = requests.get(endpoint, timeout=5, verify=True)
+                    response = self._http.get(endpoint, timeout=5)
                     # 404는 정상 (인증 등으로 인한)
                     if response.status_code >= 500:
                         self.logger.error(f"API endpoint {endpoint} returned server error: {response.status_code}")
@@ -567,27 +863,25 @@ class ProductionDeploymentTester:
     def _test_internal_connectivity(self) -> bool:
         """내부 서비스 연결 테스트"""
         try:
-            # Redis 연결 테스트 (kubectl을 통해)
-            redis_test_cmd = [
-                'kubectl', 'exec', '-n', self.config.namespace,
-                'deploy/k-ocr-redis', '--',
-                'redis-cli', 'ping'
-            ]
+            # Redis 연결 테스트 (API 서버 exec 스트림)
+            redis_pod = self._find_ready_pod('redis')
+            if not redis_pod:
+                self.logger.error("No ready Redis pod found")
+                return False
 
-            result = subprocess.run(redis_test_cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0 or 'PONG' not in result.stdout:
+            output = self._exec_in_pod(redis_pod, ['redis-cli', 'ping'])
+            if 'PONG' not in output:
                 self.logger.error("Redis connectivity test failed")
                 return False
 
             # PostgreSQL 연결 테스트
-            postgres_test_cmd = [
-                'kubectl', 'exec', '-n', self.config.namespace,
-                'deploy/k-ocr-postgres', '--',
-                'pg_isready'
-            ]
+            postgres_pod = self._find_ready_pod('postgres')
+            if not postgres_pod:
+                self.logger.error("No ready PostgreSQL pod found")
+                return False
 
-            result = subprocess.run(postgres_test_cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
+            output = self._exec_in_pod(postgres_pod, ['pg_isready'])
+            if 'accepting connections' not in output:
                 self.logger.error("PostgreSQL connectivity test failed")
                 return False
 
@@ -597,6 +891,29 @@ class ProductionDeploymentTester:
             self.logger.error(f"Internal connectivity test failed: {e}")
             return False
 
+    def _find_ready_pod(self, app_name: str) -> Optional[str]:
+        """레이블로 준비된 파드 이름 조회"""
+        pods = self._cached_list(
+            self.k8s_client.list_namespaced_pod,
+            namespace=self.config.namespace,
+            label_selector=f"app.kubernetes.io/name={app_name}"
+        )
+        for pod in pods.items:
+            if self._is_pod_ready(pod):
+                return pod.metadata.name
+        return None
+
+    def _exec_in_pod(self, pod_name: str, command: List[str], timeout: int = 30) -> str:
+        """kubectl 프로세스 없이 파드에서 명령 실행"""
+        return stream(
+            self.k8s_client.connect_get_namespaced_pod_exec,
+            pod_name,
+            self.config.namespace,
+            command=command,
+            stderr=True, stdin=False, stdout=True, tty=False,
+            _request_timeout=timeout
+        )
+
     def _test_load_performance(self) -> bool:
         """부하 및 성능 테스트"""
         try:
@@ -605,60 +922,66 @@ class ProductionDeploymentTester:
             # 부하 테스트 실행 (간단한 HTTP 요청 기반)
             app_url = f"https://{self.config.app_domain}"
 
-            # 동시 요청 테스트
-            start_time = time.time()
-            response_times = []
+            # 동시 요청 테스트 (벽시계 변동에 영향받지 않는 monotonic 사용)
+            start_time = time.monotonic()
+            latency = LatencyHistogram()
             error_count = 0
 
             def make_request():
                 try:
-                    response = requests.get(app_url, timeout=self.config.max_response_time)
+                    response = self._http.get(app_url, timeout=self.config.max_response_time)
                     return response.elapsed.total_seconds(), response.status_code == 200
                 except Exception:
                     return None, False
 
-            # 동시성 테스트
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                futures = []
-
-                # 지정된 시간 동안 요청 보내기
-                while time.time() - start_time < self.config.load_test_duration:
-                    if len(futures) < self.config.load_test_users:
-                        future = executor.submit(make_request)
-                        futures.append(future)
-
-                    # 완료된 요청 처리
-                    completed_futures = []
-                    for future in futures:
-                        if future.done():
-                            response_time, success = future.result()
-                            if success and response_time:
-                                response_times.append(response_time)
-                            else:
-                                error_count += 1
-                            completed_futures.append(future)
-
-                    # 완료된 futures 제거
-                    for future in completed_futures:
-                        futures.remove(future)
-
-                    time.sleep(0.1)
+            # 가상 사용자(생산자)는 결과를 큐에 넣고, 현재 스레드(소비자)가 집계
+            users = self.config.load_test_users
+            deadline = start_time + self.config.load_test_duration
+            results = queue.SimpleQueue()
+
+            def run_user():
+                # 각 사용자는 마감 시각까지 응답을 받는 즉시 다음 요청 (closed loop)
+                try:
+                    while time.monotonic() < deadline:
+                        results.put(make_request())
+                finally:
+                    results.put(None)
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=users) as executor:
+                for _ in range(users):
+                    executor.submit(run_user)
+
+                finished_users = 0
+                while finished_users < users:
+                    item = results.get()
+                    if item is None:
+                        finished_users += 1
+                        continue
+
+                    response_time, success = item
+                    if success and response_time:
+                        latency.record(response_time)
+                    else:
+                        error_count += 1
 
             # 결과 분석
-            total_requests = len(response_times) + error_count
+            total_requests = latency.count + error_count
             if total_requests == 0:
                 self.logger.error("No requests completed during load test")
                 return False
 
             error_rate = error_count / total_requests * 100
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0
-            max_response_time = max(response_times) if response_times else 0
+            avg_response_time = latency.mean
 
             self.logger.info(f"Load test results:")
             self.logger.info(f"  Total requests: {total_requests}")
             self.logger.info(f"  Error rate: {error_rate:.2f}%")
             self.logger.info(f"  Average response time: {avg_response_time:.2f}s")
-            self.logger.info(f"  Max response time: {max_response_time:.2f}s")
+            self.logger.info(
+                f"  p50/p95/p99 response time: {latency.percentile(50):.3f}s / "
+                f"{latency.percentile(95):.3f}s / {latency.percentile(99):.3f}s"
+            )
+            self.logger.info(f"  Max response time: {latency.max:.2f}s")
 
             # 성능 기준 확인
             if error_rate > (100 - self.config.min_availability):
@@ -711,28 +1034,39 @@ class ProductionDeploymentTester:
     def _test_ssl_configuration(self) -> bool:
         """SSL/TLS 설정 테스트"""
         try:
-            import ssl
-            import socket
-
-            hostname = self.config.app_domain
+            hostnames = [self.config.app_domain, *self.config.tls_domains]
             port = self.config.app_port
 
-            # SSL 인증서 확인
-            context = ssl.create_default_context()
+            # SSL 인증서 확인 (핸드셰이크는 GIL 을 놓으므로 스레드로 병렬 처리)
+            # HTTP 세션과 동일한 CA 번들로 검증 (사설 CA 뒤의 호스트도 확인 가능)
+            context = ssl.create_default_context(cafile=self.config.ca_bundle)
+            all_valid = True
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(hostnames)) as executor:
+                futures = {
+                    executor.submit(_fetch_certificate_expiry, context, hostname, port): hostname
+                    for hostname in hostnames
+                }
 
-            with socket.create_connection((hostname, port), timeout=10) as sock:
-                with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                    cert = ssock.getpeercert()
+                for future in concurrent.futures.as_completed(futures):
+                    hostname = futures[future]
+                    try:
+                        expires_at = future.result()
+                    except Exception as e:
+                        self.logger.error(f"SSL check failed for {hostname}: {e}")
+                        all_valid = False
+                        continue
 
                     # 인증서 만료일 확인
-                    not_after = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
-                    days_until_expiry = (not_after - datetime.now()).days
+                    days_until_expiry = int((expires_at - time.time()) // 86400)
 
                     if days_until_expiry < 30:
-                        self.logger.warning(f"SSL certificate expires in {days_until_expiry} days")
+                        self.logger.warning(f"SSL certificate for {hostname} expires in {days_until_expiry} days")
+
+                    valid_until = datetime.fromtimestamp(expires_at, timezone.utc)
+                    self.logger.info(f"SSL certificate for {hostname} valid until: {valid_until:%Y-%m-%d %H:%M:%S} UTC")
 
-                    self.logger.info(f"SSL certificate valid until: {not_after}")
-                    return True
+            return all_valid
 
         except Exception as e:
             self.logger.error(f"SSL configuration test failed: {e}")
@@ -742,17 +1076,16 @@ class ProductionDeploymentTester:
         """네트워크 정책 테스트"""
         try:
             # NetworkPolicy 리소스 확인
-            networking_api = client.NetworkingV1Api()
-
             try:
-                policies = networking_api.list_namespaced_network_policy(namespace=self.config.namespace)
+                policies = self.networking_api.list_namespaced_network_policy(namespace=self.config.namespace)
 
                 if not policies.items:
                     self.logger.warning("No network policies found in application namespace")
                     return True  # 경고만 하고 통과
 
                 for policy in policies.items:
-                    self.logger.info(f"Network policy found: {policy.metadata.name}")
+                    self.logger.debug("Network policy found: %s", policy.metadata.name)
+                self.logger.info("Found %d network policies", len(policies.items))
 
             except Exception as e:
                 self.logger.warning(f"Could not check network policies: {e}")
@@ -767,21 +1100,23 @@ class ProductionDeploymentTester:
         """시크릿 보안 테스트"""
         try:
             # 시크릿 리소스 확인
-            secrets = self.k8s_client.list_namespaced_secret(namespace=self.config.namespace)
+            # 기본 시크릿은 서버 측에서 제외
+            secrets = self._cached_list(
+                self.k8s_client.list_namespaced_secret,
+                namespace=self.config.namespace,
+                field_selector="type!=kubernetes.io/service-account-token,type!=kubernetes.io/dockerconfigjson"
+            )
 
             for secret in secrets.items:
-                # 기본 시크릿 제외
-                if secret.type in ['kubernetes.io/service-account-token', 'kubernetes.io/dockerconfigjson']:
-                    continue
-
                 # 시크릿이 base64로 인코딩되어 있는지 확인
                 if secret.data:
                     for key, value in secret.data.items():
                         if not value:  # 빈 값 확인
-                            self.logger.warning(f"Empty value in secret {secret.metadata.name}/{key}")
+                            self.logger.warning("Empty value in secret %s/%s", secret.metadata.name, key)
 
-                self.logger.info(f"Secret verified: {secret.metadata.name}")
+                self.logger.debug("Secret verified: %s", secret.metadata.name)
 
+            self.logger.info("Verified %d secrets", len(secrets.items))
             return True
 
         except Exception as e:
@@ -791,21 +1126,19 @@ class ProductionDeploymentTester:
     def _test_rbac_policies(self) -> bool:
         """RBAC 정책 테스트"""
         try:
-            rbac_api = client.RbacAuthorizationV1Api()
-
             # 서비스 어카운트 확인
-            service_accounts = self.k8s_client.list_namespaced_service_account(namespace=self.config.namespace)
+            service_accounts = self._cached_list(self.k8s_client.list_namespaced_service_account, namespace=self.config.namespace)
 
             for sa in service_accounts.items:
                 if sa.metadata.name == 'default':
                     continue
 
-                self.logger.info(f"Service account found: {sa.metadata.name}")
+                self.logger.debug("Service account found: %s", sa.metadata.name)
 
             # 역할 및 역할 바인딩 확인
             try:
-                roles = rbac_api.list_namespaced_role(namespace=self.config.namespace)
-                role_bindings = rbac_api.list_namespaced_role_binding(namespace=self.config.namespace)
+                roles = self.rbac_api.list_namespaced_role(namespace=self.config.namespace)
+                role_bindings = self.rbac_api.list_namespaced_role_binding(namespace=self.config.namespace)
 
                 self.logger.info(f"Found {len(roles.items)} roles and {len(role_bindings.items)} role bindings")
 
@@ -842,20 +1175,56 @@ class ProductionDeploymentTester:
             self.logger.error(f"Monitoring system test failed: {e}")
             return False
 
+    @cached_property
+    def _has_monitoring_namespace(self) -> bool:
+        """모니터링 네임스페이스 존재 여부 (실행당 한 번 확인)"""
+        try:
+            self.k8s_client.read_namespace(name=self.MONITORING_NAMESPACE)
+            return True
+        except ApiException as e:
+            if e.status == 404:
+                self.logger.warning(f"Namespace {self.MONITORING_NAMESPACE} not found")
+                return False
+            raise
+
+    def _get_monitoring_services(self) -> Dict[str, Any]:
+        """모니터링 서비스를 구성요소별로 매핑"""
+        # 모니터링이 설치되지 않았으면 서비스 조회 없이 모두 None
+        if not self._has_monitoring_namespace:
+            services = []
+        else:
+            services = self._cached_list(
+                self.k8s_client.list_namespaced_service,
+                namespace=self.MONITORING_NAMESPACE
+            ).items
+        return self._index_services(services, self.MONITORING_COMPONENTS)
+
+    @staticmethod
+    def _index_services(services: List[Any], keys) -> Dict[str, Any]:
+        """키별로 이름에 해당 키를 포함하는 첫 번째 서비스 매핑 (없으면 None)"""
+        found = dict.fromkeys(keys)
+        pending = list(found)
+
+        # 서비스 목록을 한 번만 순회하며 모든 키를 동시에 매칭
+        for service in services:
+            name = service.metadata.name
+            for key in pending:
+                if key in name:
+                    found[key] = service
+            pending = [key for key in pending if found[key] is None]
+            if not pending:
+                break
+
+        return found
+
     def _test_prometheus_metrics(self) -> bool:
         """Prometheus 메트릭 테스트"""
         try:
             # Prometheus 서비스 확인
-            monitoring_ns = 'monitoring'
+            monitoring_ns = self.MONITORING_NAMESPACE
 
             try:
-                services = self.k8s_client.list_namespaced_service(namespace=monitoring_ns)
-                prometheus_service = None
-
-                for service in services.items:
-                    if 'prometheus' in service.metadata.name:
-                        prometheus_service = service
-                        break
+                prometheus_service = self._get_monitoring_services()['prometheus']
 
                 if not prometheus_service:
                     self.logger.warning("Prometheus service not found")
@@ -886,16 +1255,10 @@ class ProductionDeploymentTester:
         """Grafana 대시보드 테스트"""
         try:
             # Grafana 서비스 확인
-            monitoring_ns = 'monitoring'
+            monitoring_ns = self.MONITORING_NAMESPACE
 
             try:
-                services = self.k8s_client.list_namespaced_service(namespace=monitoring_ns)
-                grafana_service = None
-
-                for service in services.items:
-                    if 'grafana' in service.metadata.name:
-                        grafana_service = service
-                        break
+                grafana_service = self._get_monitoring_services()['grafana']
 
                 if grafana_service:
                     self.logger.info(f"Grafana service found: {grafana_service.metadata.name}")
@@ -916,16 +1279,10 @@ class ProductionDeploymentTester:
         """알림 시스템 테스트"""
         try:
             # AlertManager 서비스 확인
-            monitoring_ns = 'monitoring'
+            monitoring_ns = self.MONITORING_NAMESPACE
 
             try:
-                services = self.k8s_client.list_namespaced_service(namespace=monitoring_ns)
-                alertmanager_service = None
-
-                for service in services.items:
-                    if 'alertmanager' in service.metadata.name:
-                        alertmanager_service = service
-                        break
+                alertmanager_service = self._get_monitoring_services()['alertmanager']
 
                 if alertmanager_service:
                     self.logger.info(f"AlertManager service found: {alertmanager_service.metadata.name}")
@@ -969,15 +1326,14 @@ class ProductionDeploymentTester:
     def _test_database_backup(self) -> bool:
         """데이터베이스 백업 테스트"""
         try:
-            # PostgreSQL 백업 확인
-            backup_test_cmd = [
-                'kubectl', 'exec', '-n', self.config.namespace,
-                'deploy/k-ocr-postgres', '--',
-                'pg_dump', '--version'
-            ]
+            # PostgreSQL 백업 확인 (API 서버 exec 스트림)
+            postgres_pod = self._find_ready_pod('postgres')
+            if not postgres_pod:
+                self.logger.warning("Could not test database backup capability: no ready PostgreSQL pod")
+                return True  # 경고만 하고 통과
 
-            result = subprocess.run(backup_test_cmd, capture_output=True, text=True, timeout=30)
-            if result.returncode != 0:
+            output = self._exec_in_pod(postgres_pod, ['pg_dump', '--version'])
+            if 'pg_dump' not in output:
                 self.logger.warning("Could not test database backup capability")
                 return True  # 경고만 하고 통과
 
@@ -991,13 +1347,13 @@ class ProductionDeploymentTester:
     def _test_volume_backup(self) -> bool:
         """볼륨 백업 테스트"""
         try:
-            # PersistentVolume 확인
-            pvs = self.k8s_client.list_persistent_volume()
+            # PersistentVolume 확인 (클러스터 전체 PV 대신 네임스페이스 PVC 의 바인딩 조회)
+            pvcs = self._cached_list(
+                self.k8s_client.list_namespaced_persistent_volume_claim,
+                namespace=self.config.namespace
+            )
 
-            k_ocr_pvs = [
-                pv for pv in pvs.items
-                if pv.spec.claim_ref and pv.spec.claim_ref.namespace == self.config.namespace
-            ]
+            k_ocr_pvs = [pvc.spec.volume_name for pvc in pvcs.items if pvc.spec.volume_name]
 
             if k_ocr_pvs:
                 self.logger.info(f"Found {len(k_ocr_pvs)} persistent volumes for K-OCR")
@@ -1038,42 +1394,39 @@ class ProductionDeploymentTester:
         """다중 AZ 배포 확인"""
         try:
             # 노드의 AZ 분산 확인
-            nodes = self.k8s_client.list_node()
-
-            az_distribution = {}
-            for node in nodes.items:
-                labels = node.metadata.labels or {}
-
-                # 클라우드별 AZ 레이블 확인
-                az_label = None
-                if 'topology.kubernetes.io/zone' in labels:
-                    az_label = labels['topology.kubernetes.io/zone']
-                elif 'failure-domain.beta.kubernetes.io/zone' in labels:
-                    az_label = labels['failure-domain.beta.kubernetes.io/zone']
+            nodes = self._cached_list(self.k8s_client.list_node)
 
-                if az_label:
-                    if az_label not in az_distribution:
-                        az_distribution[az_label] = 0
-                    az_distribution[az_label] += 1
+            # AZ 별 노드 수
+            az_distribution = Counter(zone for zone in map(self._node_zone, nodes.items) if zone)
 
             if len(az_distribution) < 2:
                 self.logger.warning(f"Cluster deployed in only {len(az_distribution)} availability zones")
                 return True  # 경고만 하고 통과
 
-            self.logger.info(f"Cluster distributed across {len(az_distribution)} availability zones: {list(az_distribution.keys())}")
+            self.logger.info(
+                f"Cluster distributed across {len(az_distribution)} availability zones: "
+                f"{dict(sorted(az_distribution.items()))}"
+            )
             return True
 
         except Exception as e:
             self.logger.warning(f"Multi-AZ deployment test failed: {e}")
             return True
 
+    @classmethod
+    def _node_zone(cls, node) -> Optional[str]:
+        """노드의 AZ 레이블 값 (표준 레이블 우선)"""
+        labels = node.metadata.labels or {}
+        for label in cls.ZONE_LABELS:
+            if label in labels:
+                return labels[label]
+        return None
+
     def _test_failover_readiness(self) -> bool:
         """페일오버 준비 상태 테스트"""
         try:
             # 중요 서비스의 복제본 수 확인
-            apps_api = client.AppsV1Api()
-
-            deployments = apps_api.list_namespaced_deployment(namespace=self.config.namespace)
+            deployments = self.apps_api.list_namespaced_deployment(namespace=self.config.namespace)
 
             for deployment in deployments.items:
                 replicas = deployment.spec.replicas or 1
@@ -1103,16 +1456,20 @@ class ProductionDeploymentTester:
             # 응답 시간 벤치마크
             app_url = f"https://{self.config.app_domain}"
 
-            response_times = []
-            for i in range(10):
-                start_time = time.time()
+            def probe(_) -> Optional[float]:
+                start_time = time.perf_counter()
                 try:
-                    response = requests.get(app_url, timeout=10)
+                    response = self._http.get(app_url, timeout=10)
                     if response.status_code == 200:
-                        response_times.append(time.time() - start_time)
+                        return time.perf_counter() - start_time
                 except Exception:
                     pass
-                time.sleep(1)
+                return None
+
+            # 풀링된 세션으로 샘플 요청을 동시에 전송
+            samples = self.BENCHMARK_SAMPLES
+            with concurrent.futures.ThreadPoolExecutor(max_workers=samples) as executor:
+                response_times = [t for t in executor.map(probe, range(samples)) if t is not None]
 
             if response_times:
                 performance_metrics['avg_response_time'] = sum(response_times) / len(response_times)
@@ -1136,11 +1493,16 @@ class ProductionDeploymentTester:
     def _collect_resource_metrics(self, metrics: Dict[str, Any]) -> bool:
         """리소스 메트릭 수집"""
         try:
-            # 클러스터 리소스 사용률 확인 (간단한 버전)
-            pods = self.k8s_client.list_namespaced_pod(namespace=self.config.namespace)
+            # 클러스터 리소스 사용률 확인 (배포 확인 단계와 같은 레이블 조회 재사용)
+            pods = self._cached_list(
+                self.k8s_client.list_namespaced_pod,
+                namespace=self.config.namespace,
+                label_selector=self.APP_POD_SELECTOR
+            )
 
-            total_pods = len(pods.items)
-            running_pods = sum(1 for pod in pods.items if pod.status.phase == 'Running')
+            phases = Counter(pod.status.phase for pod in pods.items)
+            total_pods = sum(phases.values())
+            running_pods = phases['Running']
 
             metrics['total_pods'] = total_pods
             metrics['running_pods'] = running_pods
@@ -1178,8 +1540,7 @@ class ProductionDeploymentTester:
             # 리포트 저장
             report_file = f"production_performance_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            Path(report_file).write_bytes(_dump_json_bytes(report))
 
             self.logger.info(f"Performance report saved to: {report_file}")
 
@@ -1191,7 +1552,7 @@ class ProductionDeploymentTester:
         total_phases = len(phase_results)
         successful_phases = sum(1 for result in phase_results.values() if result.get('success', False))
 
-        total_duration = time.time() - self.test_start_time.timestamp()
+        total_duration = time.monotonic() - self._t0
 
         summary = {
             'test_summary': {
@@ -1227,9 +1588,15 @@ class ProductionDeploymentTester:
             # 실패한 단계 나열
             failed_phases = [
                 phase for phase, result in phase_results.items()
-                if not result.get('success', False)
+                if not result.get('success', False) and not result.get('skipped', False)
+            ]
+            skipped_phases = [
+                phase for phase, result in phase_results.items()
+                if result.get('skipped', False)
             ]
             self.logger.error(f"Failed phases: {', '.join(failed_phases)}")
+            if skipped_phases:
+                self.logger.warning(f"Skipped phases: {', '.join(skipped_phases)}")
 
         self.logger.info("="*80)
 
@@ -1237,8 +1604,7 @@ class ProductionDeploymentTester:
         try:
             summary_file = f"production_test_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            Path(summary_file).write_bytes(_dump_json_bytes(summary))
 
             self.logger.info(f"Test summary saved to: {summary_file}")
 
@@ -1247,7 +1613,8 @@ class ProductionDeploymentTester:
 
         # 알림 전송
         if self.config.slack_webhook_url and "slack" in self.config.alert_channels:
-            self._send_slack_notification(summary)
+            # 결과에 영향이 없으므로 백그라운드로 전송 (close() 에서 완료 대기)
+            self._background.submit(self._send_slack_notification, summary)
 
         return summary
 
@@ -1291,9 +1658,11 @@ class ProductionDeploymentTester:
                 ]
             }
 
-            response = requests.post(
+            # 페이로드는 한 번만 직렬화하여 바이트로 전송
+            response = self._http.post(
                 self.config.slack_webhook_url,
-                json=message,
+                data=_dump_json_bytes(message, indent=False),
+                headers={'Content-Type': 'application/json'},
                 timeout=10
             )
 
@@ -1315,6 +1684,8 @@ def main():
         cluster_name=os.getenv('CLUSTER_NAME', 'k-ocr-production-cluster'),
         namespace=os.getenv('K8S_NAMESPACE', 'k-ocr'),
         app_domain=os.getenv('APP_DOMAIN', 'k-ocr.yourdomain.com'),
+        tls_domains=[d for d in os.getenv('TLS_DOMAINS', '').split(',') if d],
+        ca_bundle=os.getenv('CA_BUNDLE'),
         slack_webhook_url=os.getenv('SLACK_WEBHOOK_URL')
     )
 
@@ -1322,7 +1693,10 @@ def main():
     tester = ProductionDeploymentTester(config)
 
     # 모든 테스트 실행
-    results = tester.run_all_tests()
+    try:
+        results = tester.run_all_tests()
+    finally:
+        tester.close()
 
     # 종료 코드 설정
     exit_code = 0 if results.get('overall_success', False) else 1